@@ -230,6 +230,7 @@ def buildScriptArtifacts (config : ReleaseConfig) (outputDir : String) : IO (Lis
     "scripts/check-performance-regression.py",
     "scripts/performance-comparison.py",
     "scripts/generate-performance-report.py",
+    "scripts/performance-report.css",
     "scripts/CoverageReport.lean",
     "scripts/BuildRelease.lean",
     "scripts/GenerateDocs.lean",
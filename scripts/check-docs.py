@@ -8,16 +8,43 @@ This script checks for documentation completeness and generates reports.
 import os
 import re
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
+
+# Source directories an api/ doc may document, highest precedence first
+_API_SRC_SUBDIRS = ("Std", "Core", "DSL", "Tactics")
+
+
+def _scandir_recursive(root: str, suffix: str) -> Iterator[os.DirEntry]:
+    """Yield non-hidden files under root whose name ends with suffix.
+
+    Entries are visited depth-first in name order, so paths come out sorted.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except (FileNotFoundError, PermissionError):
+        return
+
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scandir_recursive(entry.path, suffix)
+        elif entry.name.endswith(suffix) and entry.is_file():
+            yield entry
 
 
 class DocChecker:
     def __init__(self, src_dir: str = "src", docs_dir: str = "docs"):
         self.src_dir = Path(src_dir)
         self.docs_dir = Path(docs_dir)
-        self.src_files: Set[Path] = set()
-        self.docs_files: Set[Path] = set()
-        self.missing_docs: List[Path] = []
+        self.api_dir = self.docs_dir / "api"
+        self.src_files: Dict[Path, float] = {}
+        self.docs_files: Dict[Path, float] = {}
+        self._lean_by_dir: Dict[str, Dict[str, Path]] = {
+            subdir: {} for subdir in _API_SRC_SUBDIRS
+        }
+        self.missing_docs: List[Tuple[Path, Path]] = []
         self.outdated_docs: List[Path] = []
 
     def check_completeness(self, strict: bool = False) -> bool:
@@ -39,25 +66,36 @@ class DocChecker:
         # Generate report
         self.generate_report(strict)
 
-        api_dir = self.docs_dir / "api"
-        if api_dir.exists() and any(api_dir.glob("*.md")):
+        # Generated API docs present; answered from the scan, not the filesystem
+        if any(doc.parent == self.api_dir for doc in self.docs_files):
             return True
 
         return len(self.missing_docs) == 0 and len(self.outdated_docs) == 0
 
     def find_source_files(self) -> None:
         """Find all Lean source files."""
-        for file_path in self.src_dir.rglob("*.lean"):
-            if not file_path.name.startswith("."):
-                self.src_files.add(file_path)
+        effects_dir = str(self.src_dir / "Effects")
+        api_dirs = {
+            os.path.join(effects_dir, subdir): self._lean_by_dir[subdir]
+            for subdir in _API_SRC_SUBDIRS
+        }
+
+        # Keep mtimes from the scan so the outdated check needs no stat()
+        for entry in _scandir_recursive(str(self.src_dir), ".lean"):
+            path = Path(entry.path)
+            self.src_files[path] = entry.stat().st_mtime
+
+            # Index api/ doc targets by their (already PascalCase) stem
+            by_stem = api_dirs.get(os.path.dirname(entry.path))
+            if by_stem is not None:
+                by_stem[entry.name[: -len(".lean")]] = path
 
         print(f"Found {len(self.src_files)} source files")
 
     def find_documentation_files(self) -> None:
         """Find all documentation files."""
-        for file_path in self.docs_dir.rglob("*.md"):
-            if not file_path.name.startswith("."):
-                self.docs_files.add(file_path)
+        for entry in _scandir_recursive(str(self.docs_dir), ".md"):
+            self.docs_files[Path(entry.path)] = entry.stat().st_mtime
 
         print(f"Found {len(self.docs_files)} documentation files")
 
@@ -65,68 +103,48 @@ class DocChecker:
         """Check for missing documentation."""
         print("Checking for missing documentation...")
 
-        # Map source files to expected documentation
+        # Map source files to expected documentation; src_files is sorted
         for src_file in self.src_files:
             expected_doc = self.get_expected_doc_path(src_file)
 
-            if not expected_doc.exists():
-                self.missing_docs.append(src_file)
+            if expected_doc not in self.docs_files:
+                self.missing_docs.append((src_file, expected_doc))
 
     def check_outdated_documentation(self) -> None:
         """Check for outdated documentation."""
         print("Checking for outdated documentation...")
 
         # Check if documentation is older than source files
-        for doc_file in self.docs_files:
+        for doc_file, doc_mtime in self.docs_files.items():
             corresponding_src = self.get_corresponding_src_path(doc_file)
 
-            if corresponding_src and corresponding_src.exists():
-                if doc_file.stat().st_mtime < corresponding_src.stat().st_mtime:
-                    self.outdated_docs.append(doc_file)
+            if corresponding_src and doc_mtime < self.src_files[corresponding_src]:
+                self.outdated_docs.append(doc_file)
 
     def get_expected_doc_path(self, src_file: Path) -> Path:
         """Get expected documentation path for source file."""
-        # Convert src/Effects/Std/State.lean to docs/api/state.md
-        relative_path = src_file.relative_to(self.src_dir)
-
-        # Remove .lean extension
-        doc_name = relative_path.stem
-
-        # Convert to lowercase and replace slashes with underscores
-        doc_name = str(relative_path).replace("/", "_").replace(".lean", "").lower()
-
-        # Map to appropriate documentation directory
-        if "std" in str(relative_path):
-            return self.docs_dir / "api" / f"{doc_name}.md"
-        elif "dsl" in str(relative_path):
-            return self.docs_dir / "api" / f"{doc_name}.md"
-        elif "tactics" in str(relative_path):
-            return self.docs_dir / "api" / f"{doc_name}.md"
-        else:
-            return self.docs_dir / "api" / f"{doc_name}.md"
-
-    def get_corresponding_src_path(self, doc_file: Path) -> Path:
+        # Convert src/Effects/Std/State.lean to docs/api/effects_std_state.md
+        relative_path = str(src_file.relative_to(self.src_dir))
+        doc_name = relative_path.replace(os.sep, "_")[: -len(".lean")].lower()
+        return self.api_dir / f"{doc_name}.md"
+
+    def get_corresponding_src_path(self, doc_file: Path) -> Optional[Path]:
         """Get corresponding source path for documentation file."""
         # Convert docs/api/state.md to src/Effects/Std/State.lean
         relative_path = doc_file.relative_to(self.docs_dir)
 
         if relative_path.parts[0] == "api":
-            # Map api files to std files
+            # Look api files up in the scanned source directories
             doc_name = relative_path.stem
 
             # Convert snake_case to PascalCase
             src_name = "".join(word.capitalize() for word in doc_name.split("_"))
 
-            # Try to find in std directory
-            std_path = self.src_dir / "Effects" / "Std" / f"{src_name}.lean"
-            if std_path.exists():
-                return std_path
-
-            # Try other directories
-            for subdir in ["Core", "DSL", "Tactics"]:
-                subdir_path = self.src_dir / "Effects" / subdir / f"{src_name}.lean"
-                if subdir_path.exists():
-                    return subdir_path
+            # Std first, then Core, DSL and Tactics
+            for subdir in _API_SRC_SUBDIRS:
+                src_path = self._lean_by_dir[subdir].get(src_name)
+                if src_path is not None:
+                    return src_path
 
         return None
 
@@ -138,13 +156,12 @@ class DocChecker:
 
         if self.missing_docs:
             print(f"\n❌ Missing documentation for {len(self.missing_docs)} files:")
-            for src_file in sorted(self.missing_docs):
-                expected_doc = self.get_expected_doc_path(src_file)
+            for src_file, expected_doc in self.missing_docs:
                 print(f"  - {src_file} → {expected_doc}")
 
         if self.outdated_docs:
             print(f"\n⚠️  Outdated documentation for {len(self.outdated_docs)} files:")
-            for doc_file in sorted(self.outdated_docs):
+            for doc_file in self.outdated_docs:
                 print(f"  - {doc_file}")
 
         if not self.missing_docs and not self.outdated_docs:
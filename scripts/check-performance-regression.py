@@ -5,12 +5,29 @@ Compares current performance with baseline and detects regressions
 """
 
 import json
+import math
 import sys
 import argparse
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-import statistics
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json(path: Path):
+    """Parse a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+# (avg execution time ms, avg memory MB, failure rate, successful, total)
+Metrics = Tuple[float, float, float, int, int]
 
 
 @dataclass
@@ -43,8 +60,8 @@ class PerformanceRegressionDetector:
     def __init__(self, thresholds: RegressionThresholds):
         self.thresholds = thresholds
 
-    def load_baseline(self, baseline_file: str) -> Optional[Dict]:
-        """Load baseline performance data"""
+    def load_baseline(self, baseline_file: str) -> Optional[Metrics]:
+        """Load baseline performance data and extract its metrics"""
         baseline_path = Path(baseline_file)
 
         if not baseline_path.exists():
@@ -52,14 +69,13 @@ class PerformanceRegressionDetector:
             return None
 
         try:
-            with open(baseline_path, "r") as f:
-                return json.load(f)
+            return self._extract_metrics(_load_json(baseline_path))
         except Exception as e:
             print(f"Error loading baseline: {e}")
             return None
 
-    def load_current(self, current_file: str) -> Optional[Dict]:
-        """Load current performance data"""
+    def load_current(self, current_file: str) -> Optional[Metrics]:
+        """Load current performance data and extract its metrics"""
         current_path = Path(current_file)
 
         if not current_path.exists():
@@ -67,65 +83,60 @@ class PerformanceRegressionDetector:
             return None
 
         try:
-            with open(current_path, "r") as f:
-                return json.load(f)
+            return self._extract_metrics(_load_json(current_path))
         except Exception as e:
             print(f"Error loading current performance: {e}")
             return None
 
-    def extract_metrics(self, data: Dict) -> Tuple[float, float, float, int, int]:
-        """Extract key metrics from performance data"""
+    def _extract_metrics(self, data) -> Metrics:
+        """Dispatch on the data format once, when it is loaded"""
         if isinstance(data, list):
-            # Handle list of benchmark results
-            successful_results = [r for r in data if r.get("success", False)]
-            failed_results = [r for r in data if not r.get("success", False)]
-
-            if not successful_results:
-                return 0.0, 0.0, 1.0, 0, len(data)
-
-            execution_times = [
-                r.get("metrics", {}).get("executionTime", 0) for r in successful_results
-            ]
-            memory_usage = [
-                r.get("metrics", {}).get("memoryUsage", 0) for r in successful_results
-            ]
-
-            avg_execution_time = (
-                statistics.mean(execution_times) if execution_times else 0.0
-            )
-            avg_memory_usage = (
-                statistics.mean(memory_usage) / (1024 * 1024) if memory_usage else 0.0
-            )  # Convert to MB
-            failure_rate = len(failed_results) / len(data) if data else 0.0
-
-            return (
-                avg_execution_time,
-                avg_memory_usage,
-                failure_rate,
-                len(successful_results),
-                len(data),
-            )
+            return self._extract_from_list(data)
+        if isinstance(data, dict):
+            return self._extract_from_dict(data)
+        return 0.0, 0.0, 0.0, 0, 0
 
-        elif isinstance(data, dict):
-            # Handle summary format
-            return (
-                data.get("avg_execution_time", 0.0),
-                data.get("memory_usage", 0.0),
-                data.get("failed_benchmarks", 0)
-                / max(data.get("total_benchmarks", 1), 1),
-                data.get("successful_benchmarks", 0),
-                data.get("total_benchmarks", 0),
-            )
+    def _extract_from_list(self, data: List[Dict]) -> Metrics:
+        """Extract key metrics from a list of benchmark results"""
+        # Single pass over the results, summed with fsum for correct rounding
+        execution_times: List[float] = []
+        memory_usage: List[float] = []
+        for r in data:
+            if r.get("success", False):
+                metrics = r.get("metrics", {})
+                execution_times.append(metrics.get("executionTime", 0))
+                memory_usage.append(metrics.get("memoryUsage", 0))
+
+        successful = len(execution_times)
+        if not successful:
+            return 0.0, 0.0, 1.0, 0, len(data)
+
+        avg_execution_time = math.fsum(execution_times) / successful
+        avg_memory_usage = math.fsum(memory_usage) / successful / (1024 * 1024)  # MB
+        failure_rate = (len(data) - successful) / len(data)
+
+        return (
+            avg_execution_time,
+            avg_memory_usage,
+            failure_rate,
+            successful,
+            len(data),
+        )
 
-        return 0.0, 0.0, 0.0, 0, 0
+    def _extract_from_dict(self, data: Dict) -> Metrics:
+        """Extract key metrics from a performance summary"""
+        return (
+            data.get("avg_execution_time", 0.0),
+            data.get("memory_usage", 0.0),
+            data.get("failed_benchmarks", 0) / max(data.get("total_benchmarks", 1), 1),
+            data.get("successful_benchmarks", 0),
+            data.get("total_benchmarks", 0),
+        )
 
     def detect_regression(
-        self, baseline_data: Dict, current_data: Dict
+        self, baseline_metrics: Metrics, current_metrics: Metrics
     ) -> RegressionResult:
-        """Detect performance regression"""
-        baseline_metrics = self.extract_metrics(baseline_data)
-        current_metrics = self.extract_metrics(current_data)
-
+        """Detect performance regression from extracted metrics"""
         (
             baseline_time,
             baseline_memory,
@@ -216,7 +227,9 @@ class PerformanceRegressionDetector:
             recommendations=recommendations,
         )
 
-    def print_comparison(self, baseline_metrics: Tuple, current_metrics: Tuple) -> None:
+    def print_comparison(
+        self, baseline_metrics: Metrics, current_metrics: Metrics
+    ) -> None:
         """Print performance comparison"""
         (
             baseline_time,
@@ -303,21 +316,19 @@ def main():
     # Create detector
     detector = PerformanceRegressionDetector(thresholds)
 
-    # Load data
-    baseline_data = detector.load_baseline(args.baseline)
-    current_data = detector.load_current(args.current)
+    # Load data; metrics are extracted once, at load time
+    baseline_metrics = detector.load_baseline(args.baseline)
+    current_metrics = detector.load_current(args.current)
 
-    if baseline_data is None or current_data is None:
+    if baseline_metrics is None or current_metrics is None:
         print("Error: Could not load performance data")
         sys.exit(1)
 
     # Print comparison
-    baseline_metrics = detector.extract_metrics(baseline_data)
-    current_metrics = detector.extract_metrics(current_data)
     detector.print_comparison(baseline_metrics, current_metrics)
 
     # Detect regression
-    result = detector.detect_regression(baseline_data, current_data)
+    result = detector.detect_regression(baseline_metrics, current_metrics)
 
     print("\nRegression Analysis")
     print("=" * 20)
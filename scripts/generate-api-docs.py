@@ -7,10 +7,53 @@ This script generates comprehensive API documentation from the Lean source code.
 
 import os
 import re
+import bisect
+import io
+import mmap
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+# Declaration patterns, compiled once for every module parsed. They run over
+# the raw file bytes; only the captured groups are decoded. Declarations are
+# matched inside a lookahead, so a match consumes nothing and one declaration
+# spilling onto the next line cannot hide the declaration that follows it.
+_IMPORT_RE = re.compile(rb"import\s+([^\s\n]+)")
+_DECL_RE = re.compile(
+    rb"(?=(?P<kind>def|theorem|class)\s+(?P<name>[a-zA-Z_][a-zA-Z0-9_]*)"
+    rb"\s*[:\s]*(?P<type>[^:=\n]+)"
+    rb"|namespace\s+(?P<namespace>[a-zA-Z_][a-zA-Z0-9_]*))"
+)
+
+# Maps a declaration keyword to its list in the module info
+_DECL_SECTIONS = {b"def": "definitions", b"theorem": "theorems", b"class": "classes"}
+
+# Output older than this script is regenerated, since the format may have changed
+_SCRIPT_MTIME = os.stat(__file__).st_mtime
+
+# Modules to document, keyed by API category
+API_MODULES = {
+    "core": [
+        "Effects.lean",
+        "Effects/Core/Free.lean",
+        "Effects/Core/Handler.lean",
+        "Effects/Core/Fusion.lean",
+    ],
+    "stdlib": [
+        "Effects/Std/State.lean",
+        "Effects/Std/Reader.lean",
+        "Effects/Std/Writer.lean",
+        "Effects/Std/Exception.lean",
+        "Effects/Std/Nondet.lean",
+    ],
+    "dsl": ["Effects/DSL/Syntax.lean", "Effects/DSL/Elab.lean"],
+    "tactics": [
+        "Effects/Tactics/EffectFuse.lean",
+        "Effects/Tactics/HandlerLaws.lean",
+    ],
+}
+
 
 class LeanDocGenerator:
     def __init__(self, src_dir: str = "src", docs_dir: str = "docs"):
@@ -25,71 +68,44 @@ class LeanDocGenerator:
         # Ensure output directory exists
         self.api_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate documentation for each module
-        self.generate_core_docs()
-        self.generate_stdlib_docs()
-        self.generate_dsl_docs()
-        self.generate_tactics_docs()
+        # Drop missing modules before spawning any workers
+        modules: List[str] = []
+        categories: List[str] = []
+        for category, module_paths in API_MODULES.items():
+            for module_path in module_paths:
+                if (self.src_dir / module_path).exists():
+                    modules.append(module_path)
+                    categories.append(category)
+                else:
+                    print(f"Warning: Module {module_path} not found")
+
+        # Modules are independent, so parse and render them in parallel
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(self.generate_module_docs, modules, categories)
+            for module_path, generated in zip(modules, results):
+                if generated:
+                    print(f"Generated docs for {module_path}")
+                else:
+                    print(f"Docs for {module_path} are up to date")
 
         print("API documentation generation complete!")
 
-    def generate_core_docs(self) -> None:
-        """Generate core API documentation."""
-        print("Generating core API docs...")
-
-        core_modules = [
-            "Effects.lean",
-            "Effects/Core/Free.lean",
-            "Effects/Core/Handler.lean",
-            "Effects/Core/Fusion.lean",
-        ]
-
-        for module in core_modules:
-            self.generate_module_docs(module, "core")
-
-    def generate_stdlib_docs(self) -> None:
-        """Generate standard library documentation."""
-        print("Generating stdlib API docs...")
-
-        stdlib_modules = [
-            "Effects/Std/State.lean",
-            "Effects/Std/Reader.lean",
-            "Effects/Std/Writer.lean",
-            "Effects/Std/Exception.lean",
-            "Effects/Std/Nondet.lean",
-        ]
-
-        for module in stdlib_modules:
-            self.generate_module_docs(module, "stdlib")
-
-    def generate_dsl_docs(self) -> None:
-        """Generate DSL documentation."""
-        print("Generating DSL API docs...")
-
-        dsl_modules = ["Effects/DSL/Syntax.lean", "Effects/DSL/Elab.lean"]
-
-        for module in dsl_modules:
-            self.generate_module_docs(module, "dsl")
+    def generate_module_docs(self, module_path: str, category: str) -> bool:
+        """Generate documentation for a specific module.
 
-    def generate_tactics_docs(self) -> None:
-        """Generate tactics documentation."""
-        print("Generating tactics API docs...")
-
-        tactics_modules = [
-            "Effects/Tactics/EffectFuse.lean",
-            "Effects/Tactics/HandlerLaws.lean",
-        ]
-
-        for module in tactics_modules:
-            self.generate_module_docs(module, "tactics")
-
-    def generate_module_docs(self, module_path: str, category: str) -> None:
-        """Generate documentation for a specific module."""
+        Returns False if the existing output is newer than both the module and
+        this script, in which case nothing is regenerated.
+        """
         full_path = self.src_dir / module_path
+        output_file = self.api_dir / f"{category}_{Path(module_path).stem}.md"
 
-        if not full_path.exists():
-            print(f"Warning: Module {module_path} not found")
-            return
+        try:
+            output_mtime = output_file.stat().st_mtime
+        except FileNotFoundError:
+            pass
+        else:
+            if output_mtime >= max(full_path.stat().st_mtime, _SCRIPT_MTIME):
+                return False
 
         # Parse the module
         module_info = self.parse_module(full_path)
@@ -98,14 +114,26 @@ class LeanDocGenerator:
         markdown = self.generate_markdown(module_info, category)
 
         # Write to file
-        output_file = self.api_dir / f"{category}_{Path(module_path).stem}.md"
         output_file.write_text(markdown)
 
-        print(f"Generated docs for {module_path}")
+        return True
 
     def parse_module(self, file_path: Path) -> Dict[str, Any]:
         """Parse a Lean module and extract documentation information."""
-        content = file_path.read_text()
+        with open(file_path, "rb") as f:
+            # mmap refuses empty files
+            if os.fstat(f.fileno()).st_size == 0:
+                return self._parse_content(file_path, b"")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return self._parse_content(file_path, content)
+
+    def _parse_content(self, file_path: Path, content: bytes) -> Dict[str, Any]:
+        """Extract documentation information from a module's raw bytes."""
+        # Offsets of every newline, so a match's line is a binary search
+        newlines = [m.start() for m in re.finditer(b"\n", content)]
+
+        def line_of(pos: int) -> int:
+            return bisect.bisect_left(newlines, pos) + 1
 
         module_info = {
             "name": file_path.stem,
@@ -119,118 +147,69 @@ class LeanDocGenerator:
         }
 
         # Extract imports
-        import_pattern = r"import\s+([^\s\n]+)"
-        module_info["imports"] = re.findall(import_pattern, content)
-
-        # Extract definitions
-        def_pattern = r"def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*[:\s]*([^:=\n]+)"
-        for match in re.finditer(def_pattern, content):
-            module_info["definitions"].append(
-                {
-                    "name": match.group(1),
-                    "type": match.group(2).strip(),
-                    "line": content[: match.start()].count("\n") + 1,
-                }
-            )
-
-        # Extract theorems
-        theorem_pattern = r"theorem\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*[:\s]*([^:=\n]+)"
-        for match in re.finditer(theorem_pattern, content):
-            module_info["theorems"].append(
-                {
-                    "name": match.group(1),
-                    "type": match.group(2).strip(),
-                    "line": content[: match.start()].count("\n") + 1,
-                }
-            )
-
-        # Extract classes
-        class_pattern = r"class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*[:\s]*([^:=\n]+)"
-        for match in re.finditer(class_pattern, content):
-            module_info["classes"].append(
-                {
-                    "name": match.group(1),
-                    "type": match.group(2).strip(),
-                    "line": content[: match.start()].count("\n") + 1,
-                }
-            )
-
-        # Extract namespaces
-        namespace_pattern = r"namespace\s+([a-zA-Z_][a-zA-Z0-9_]*)"
-        for match in re.finditer(namespace_pattern, content):
-            module_info["namespaces"].append(
-                {
-                    "name": match.group(1),
-                    "line": content[: match.start()].count("\n") + 1,
-                }
-            )
+        module_info["imports"] = [
+            imp.decode("utf-8") for imp in _IMPORT_RE.findall(content)
+        ]
+
+        # Extract definitions, theorems, classes and namespaces in one scan
+        for match in _DECL_RE.finditer(content):
+            namespace = match.group("namespace")
+            if namespace is not None:
+                module_info["namespaces"].append(
+                    {
+                        "name": namespace.decode("ascii"),
+                        "line": line_of(match.start()),
+                    }
+                )
+            else:
+                module_info[_DECL_SECTIONS[match.group("kind")]].append(
+                    {
+                        "name": match.group("name").decode("ascii"),
+                        "type": match.group("type").decode("utf-8").strip(),
+                        "line": line_of(match.start()),
+                    }
+                )
 
         return module_info
 
     def generate_markdown(self, module_info: Dict[str, Any], category: str) -> str:
         """Generate markdown documentation from module information."""
-        lines = []
+        buf = io.StringIO()
 
-        # Header
-        lines.append(f"# {module_info['name']} API")
-        lines.append("")
-        lines.append(f"**Category**: {category}")
-        lines.append(f"**File**: `{module_info['path']}`")
-        lines.append("")
+        # Header; every later section writes its own leading blank line
+        buf.write(
+            f"# {module_info['name']} API\n\n"
+            f"**Category**: {category}\n"
+            f"**File**: `{module_info['path']}`\n"
+        )
 
         # Imports
         if module_info["imports"]:
-            lines.append("## Imports")
-            lines.append("")
+            buf.write("\n## Imports\n\n")
             for imp in module_info["imports"]:
-                lines.append(f"- `{imp}`")
-            lines.append("")
+                buf.write(f"- `{imp}`\n")
 
         # Namespaces
         if module_info["namespaces"]:
-            lines.append("## Namespaces")
-            lines.append("")
+            buf.write("\n## Namespaces\n\n")
             for ns in module_info["namespaces"]:
-                lines.append(f"- `{ns['name']}`")
-            lines.append("")
-
-        # Classes
-        if module_info["classes"]:
-            lines.append("## Classes")
-            lines.append("")
-            for cls in module_info["classes"]:
-                lines.append(f"### {cls['name']}")
-                lines.append("")
-                lines.append(f"```lean")
-                lines.append(f"class {cls['name']} : {cls['type']}")
-                lines.append(f"```")
-                lines.append("")
-
-        # Definitions
-        if module_info["definitions"]:
-            lines.append("## Definitions")
-            lines.append("")
-            for defn in module_info["definitions"]:
-                lines.append(f"### {defn['name']}")
-                lines.append("")
-                lines.append(f"```lean")
-                lines.append(f"def {defn['name']} : {defn['type']}")
-                lines.append(f"```")
-                lines.append("")
-
-        # Theorems
-        if module_info["theorems"]:
-            lines.append("## Theorems")
-            lines.append("")
-            for thm in module_info["theorems"]:
-                lines.append(f"### {thm['name']}")
-                lines.append("")
-                lines.append(f"```lean")
-                lines.append(f"theorem {thm['name']} : {thm['type']}")
-                lines.append(f"```")
-                lines.append("")
-
-        return "\n".join(lines)
+                buf.write(f"- `{ns['name']}`\n")
+
+        # Classes, definitions and theorems
+        for title, key, keyword in (
+            ("Classes", "classes", "class"),
+            ("Definitions", "definitions", "def"),
+            ("Theorems", "theorems", "theorem"),
+        ):
+            if module_info[key]:
+                buf.write(f"\n## {title}\n")
+                for decl in module_info[key]:
+                    buf.write(
+                        f"\n### {decl['name']}\n\n"
+                        f"```lean\n{keyword} {decl['name']} : {decl['type']}\n```\n"
+                    )
+
+        return buf.getvalue()
 
 
 def main():
@@ -8,158 +8,34 @@ import json
 import os
 import sys
 import argparse
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
 from datetime import datetime
 import base64
-import io
+import shutil
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from string import Template
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def generate_html_report(data: Dict, output_file: str) -> None:
-    """Generate HTML performance report"""
+# Stylesheet shipped alongside this script
+_REPORT_CSS_FILE = Path(__file__).with_name("performance-report.css")
 
-    # Extract data
-    summary = data.get("summary", {})
-    recommendations = data.get("recommendations", [])
-    charts = data.get("charts", [])
-
-    # Generate HTML
-    html = f"""
+# Report page, parsed once at import and split around the chart and
+# recommendation sections so those can be streamed straight to the file.
+# The styles live in a static stylesheet, linked or inlined via ${styles}.
+_REPORT_HEADER = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>lean-effects Performance Report</title>
-        <style>
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 1200px;
-                margin: 0 auto;
-                padding: 20px;
-                background-color: #f5f5f5;
-            }}
-            .header {{
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                padding: 30px;
-                border-radius: 10px;
-                margin-bottom: 30px;
-                text-align: center;
-            }}
-            .header h1 {{
-                margin: 0;
-                font-size: 2.5em;
-                font-weight: 300;
-            }}
-            .header p {{
-                margin: 10px 0 0 0;
-                opacity: 0.9;
-                font-size: 1.1em;
-            }}
-            .summary {{
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-                gap: 20px;
-                margin-bottom: 30px;
-            }}
-            .summary-card {{
-                background: white;
-                padding: 25px;
-                border-radius: 10px;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                text-align: center;
-            }}
-            .summary-card h3 {{
-                margin: 0 0 10px 0;
-                color: #666;
-                font-size: 0.9em;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-            }}
-            .summary-card .value {{
-                font-size: 2.5em;
-                font-weight: bold;
-                margin: 0;
-            }}
-            .summary-card .status {{
-                font-size: 1.2em;
-                font-weight: bold;
-                margin: 10px 0 0 0;
-            }}
-            .status.pass {{
-                color: #27ae60;
-            }}
-            .status.fail {{
-                color: #e74c3c;
-            }}
-            .status.warning {{
-                color: #f39c12;
-            }}
-            .charts {{
-                background: white;
-                padding: 30px;
-                border-radius: 10px;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                margin-bottom: 30px;
-            }}
-            .charts h2 {{
-                margin: 0 0 20px 0;
-                color: #333;
-                border-bottom: 2px solid #667eea;
-                padding-bottom: 10px;
-            }}
-            .chart-container {{
-                margin: 20px 0;
-                text-align: center;
-            }}
-            .chart-container img {{
-                max-width: 100%;
-                height: auto;
-                border-radius: 5px;
-                box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-            }}
-            .recommendations {{
-                background: white;
-                padding: 30px;
-                border-radius: 10px;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            }}
-            .recommendations h2 {{
-                margin: 0 0 20px 0;
-                color: #333;
-                border-bottom: 2px solid #667eea;
-                padding-bottom: 10px;
-            }}
-            .recommendation {{
-                background: #f8f9fa;
-                padding: 15px;
-                margin: 10px 0;
-                border-left: 4px solid #667eea;
-                border-radius: 0 5px 5px 0;
-            }}
-            .recommendation:before {{
-                content: "💡 ";
-                font-size: 1.2em;
-            }}
-            .footer {{
-                text-align: center;
-                margin-top: 40px;
-                padding: 20px;
-                color: #666;
-                border-top: 1px solid #ddd;
-            }}
-            .timestamp {{
-                font-size: 0.9em;
-                color: #999;
-            }}
-        </style>
+        ${styles}
     </head>
     <body>
         <div class="header">
@@ -170,88 +46,237 @@ def generate_html_report(data: Dict, output_file: str) -> None:
         <div class="summary">
             <div class="summary-card">
                 <h3>Overall Status</h3>
-                <div class="value status {summary.get('status', 'unknown').lower()}">{summary.get('status', 'Unknown')}</div>
+                <div class="value status ${status_class}">${status}</div>
             </div>
             <div class="summary-card">
                 <h3>Average Execution Time</h3>
-                <div class="value">{summary.get('avg_execution_time', 0):.2f}ms</div>
+                <div class="value">${avg_execution_time}ms</div>
             </div>
             <div class="summary-card">
                 <h3>Memory Usage</h3>
-                <div class="value">{summary.get('memory_usage', 0):.2f}MB</div>
+                <div class="value">${memory_usage}MB</div>
             </div>
             <div class="summary-card">
                 <h3>Success Rate</h3>
-                <div class="value">{summary.get('success_rate', 0):.1%}</div>
+                <div class="value">${success_rate}</div>
             </div>
             <div class="summary-card">
                 <h3>Total Benchmarks</h3>
-                <div class="value">{summary.get('total_benchmarks', 0)}</div>
+                <div class="value">${total_benchmarks}</div>
             </div>
             <div class="summary-card">
                 <h3>Failed Benchmarks</h3>
-                <div class="value">{summary.get('failed_benchmarks', 0)}</div>
+                <div class="value">${failed_benchmarks}</div>
             </div>
         </div>
         
         <div class="charts">
             <h2>Performance Charts</h2>
-            {generate_chart_html(charts)}
+            """
+_REPORT_HEADER_TEMPLATE = Template(_REPORT_HEADER)
+
+_REPORT_MIDDLE = """
         </div>
         
         <div class="recommendations">
             <h2>Recommendations</h2>
-            {generate_recommendations_html(recommendations)}
+            """
+
+_REPORT_FOOTER = """
         </div>
         
         <div class="footer">
             <p>Generated by lean-effects Performance Monitor</p>
-            <p class="timestamp">Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
+            <p class="timestamp">Report generated on ${generated_at}</p>
         </div>
     </body>
     </html>
     """
+_REPORT_FOOTER_TEMPLATE = Template(_REPORT_FOOTER)
 
-    # Write HTML file
-    with open(output_file, "w") as f:
-        f.write(html)
-
-
-def generate_chart_html(charts: List[Dict]) -> str:
-    """Generate HTML for charts"""
-    if not charts:
-        return "<p>No chart data available</p>"
+_CHART_LINK = """
+            <div class="chart-container">
+                <h3>${title}</h3>
+                <img src="${src}" alt="${title}">
+            </div>
+            """
+_CHART_LINK_TEMPLATE = Template(_CHART_LINK)
 
-    html = ""
-    for chart in charts:
-        if "image" in chart:
-            html += f"""
+# Inline variant, split around the base64 payload streamed in between
+_CHART_IMAGE_OPEN = """
             <div class="chart-container">
-                <h3>{chart.get('title', 'Chart')}</h3>
-                <img src="data:image/png;base64,{chart['image']}" alt="{chart.get('title', 'Chart')}">
+                <h3>${title}</h3>
+                <img src="data:image/png;base64,"""
+_CHART_IMAGE_OPEN_TEMPLATE = Template(_CHART_IMAGE_OPEN)
+
+_CHART_IMAGE_CLOSE = """" alt="${title}">
             </div>
             """
-        else:
-            html += f"""
+_CHART_IMAGE_CLOSE_TEMPLATE = Template(_CHART_IMAGE_CLOSE)
+
+# A multiple of 3 bytes, so encoded chunks concatenate without padding
+_BASE64_CHUNK_SIZE = 48 * 1024
+
+_CHART_DATA = """
             <div class="chart-container">
-                <h3>{chart.get('title', 'Chart')}</h3>
-                <p>Chart data: {chart.get('data', 'No data')}</p>
+                <h3>${title}</h3>
+                <p>Chart data: ${data}</p>
             </div>
             """
+_CHART_DATA_TEMPLATE = Template(_CHART_DATA)
+
+_RECOMMENDATION_TEMPLATE = Template('<div class="recommendation">${text}</div>')
+
+
+def generate_html_report(data: Dict, output_file: str, inline: bool = False) -> None:
+    """Generate HTML performance report
+
+    By default the stylesheet and chart images are copied next to the report
+    and linked by name. With inline=True everything is embedded instead,
+    producing a single self-contained HTML file.
+    """
 
-    return html
+    # Extract data
+    summary = data.get("summary", {})
+    recommendations = data.get("recommendations", [])
+    charts = data.get("charts", [])
+
+    output_path = Path(output_file)
+    if inline:
+        styles = f"<style>\n{_REPORT_CSS_FILE.read_text()}</style>"
+        link_dir = None
+    else:
+        link_dir = output_path.parent
+        _copy_into(_REPORT_CSS_FILE, link_dir)
+        styles = f'<link rel="stylesheet" href="{_REPORT_CSS_FILE.name}">'
+
+    # Stream the page to the file section by section
+    with open(output_path, "w", buffering=1 << 20) as f:
+        f.write(
+            _REPORT_HEADER_TEMPLATE.substitute(
+                styles=styles,
+                status_class=summary.get("status", "unknown").lower(),
+                status=summary.get("status", "Unknown"),
+                avg_execution_time=f"{summary.get('avg_execution_time', 0):.2f}",
+                memory_usage=f"{summary.get('memory_usage', 0):.2f}",
+                success_rate=f"{summary.get('success_rate', 0):.1%}",
+                total_benchmarks=summary.get("total_benchmarks", 0),
+                failed_benchmarks=summary.get("failed_benchmarks", 0),
+            )
+        )
+        if link_dir is not None:
+            write_linked_chart_html(f, charts, link_dir)
+        else:
+            write_chart_html(f, charts)
+        f.write(_REPORT_MIDDLE)
+        write_recommendations_html(f, recommendations)
+        f.write(
+            _REPORT_FOOTER_TEMPLATE.substitute(
+                generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
+            )
+        )
 
 
-def generate_recommendations_html(recommendations: List[str]) -> str:
-    """Generate HTML for recommendations"""
+def _copy_into(src: Path, directory: Path) -> None:
+    """Copy src into directory, keeping its name"""
+    try:
+        shutil.copyfile(src, directory / src.name)
+    except shutil.SameFileError:
+        # Already in place, e.g. the report is written into the input directory
+        pass
+
+
+def write_linked_chart_html(
+    out: TextIO, charts: Iterable[Dict], link_dir: Path
+) -> None:
+    """Write HTML for charts, copying chart images into link_dir and linking them"""
+    written = False
+    for chart in charts:
+        title = chart.get("title", "Chart")
+        if "path" in chart:
+            try:
+                _copy_into(chart["path"], link_dir)
+            except OSError as e:
+                print(f"Warning: Could not load chart {chart['path']}: {e}")
+                continue
+            out.write(
+                _CHART_LINK_TEMPLATE.substitute(title=title, src=chart["path"].name)
+            )
+        else:
+            out.write(
+                _CHART_DATA_TEMPLATE.substitute(
+                    title=title, data=chart.get("data", "No data")
+                )
+            )
+        written = True
+
+    if not written:
+        out.write("<p>No chart data available</p>")
+
+
+def write_chart_html(out: TextIO, charts: Iterable[Dict]) -> None:
+    """Write HTML for charts, inlining chart images as base64 data URIs"""
+    written = False
+
+    # Read upcoming images on worker threads while earlier ones are written,
+    # keeping at most max_workers images in memory
+    max_workers = min(8, os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for chart in charts:
+            image = (
+                executor.submit(_read_chart, chart["path"]) if "path" in chart else None
+            )
+            pending.append((chart, image))
+            if len(pending) > max_workers:
+                written |= _write_chart(out, *pending.popleft())
+
+        while pending:
+            written |= _write_chart(out, *pending.popleft())
+
+    if not written:
+        out.write("<p>No chart data available</p>")
+
+
+def _read_chart(path: Path) -> bytes:
+    """Read a chart image"""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _write_chart(out: TextIO, chart: Dict, image: Optional[Future]) -> bool:
+    """Write HTML for one chart, returning False if its image was unreadable"""
+    title = chart.get("title", "Chart")
+    if image is None:
+        out.write(
+            _CHART_DATA_TEMPLATE.substitute(
+                title=title, data=chart.get("data", "No data")
+            )
+        )
+        return True
+
+    try:
+        data = memoryview(image.result())
+    except OSError as e:
+        print(f"Warning: Could not load chart {chart['path']}: {e}")
+        return False
+
+    out.write(_CHART_IMAGE_OPEN_TEMPLATE.substitute(title=title))
+    for start in range(0, len(data), _BASE64_CHUNK_SIZE):
+        chunk = data[start : start + _BASE64_CHUNK_SIZE]
+        out.write(base64.b64encode(chunk).decode("ascii"))
+    out.write(_CHART_IMAGE_CLOSE_TEMPLATE.substitute(title=title))
+    return True
+
+
+def write_recommendations_html(out: TextIO, recommendations: List[str]) -> None:
+    """Write HTML for recommendations"""
     if not recommendations:
-        return "<p>No recommendations available</p>"
+        out.write("<p>No recommendations available</p>")
+        return
 
-    html = ""
     for rec in recommendations:
-        html += f'<div class="recommendation">{rec}</div>'
-
-    return html
+        out.write(_RECOMMENDATION_TEMPLATE.substitute(text=rec))
 
 
 def load_analysis_data(input_dir: str) -> Dict:
@@ -262,36 +287,36 @@ def load_analysis_data(input_dir: str) -> Dict:
     summary_file = input_path / "performance-summary.json"
     summary = {}
     if summary_file.exists():
-        with open(summary_file, "r") as f:
-            summary = json.load(f)
+        if orjson is not None:
+            summary = orjson.loads(summary_file.read_bytes())
+        else:
+            with open(summary_file, "r") as f:
+                summary = json.load(f)
 
     # Load recommendations
     recommendations_file = input_path / "recommendations.txt"
     recommendations = []
     if recommendations_file.exists():
-        with open(recommendations_file, "r") as f:
-            recommendations = [
-                line.strip() for line in f if line.strip() and not line.startswith("=")
-            ]
+        lines = recommendations_file.read_text().splitlines()
+        recommendations = [
+            line for line in map(str.strip, lines) if line[:1] not in ("", "=")
+        ]
 
-    # Load charts
-    charts = []
-    for chart_file in input_path.glob("*.png"):
-        try:
-            with open(chart_file, "rb") as f:
-                image_data = base64.b64encode(f.read()).decode("utf-8")
-                charts.append(
-                    {
-                        "title": chart_file.stem.replace("_", " ").title(),
-                        "image": image_data,
-                    }
-                )
-        except Exception as e:
-            print(f"Warning: Could not load chart {chart_file}: {e}")
+    # Charts are only read and encoded while the report is written
+    charts = iter_charts(input_path)
 
     return {"summary": summary, "recommendations": recommendations, "charts": charts}
 
 
+def iter_charts(input_path: Path) -> Iterator[Dict]:
+    """Yield a chart entry for every PNG in the analysis directory"""
+    for chart_file in input_path.glob("*.png"):
+        yield {
+            "title": " ".join(map(str.capitalize, chart_file.stem.split("_"))),
+            "path": chart_file,
+        }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate HTML performance report for lean-effects"
@@ -302,6 +327,11 @@ def main():
     parser.add_argument(
         "--output", default="performance-report.html", help="Output HTML file"
     )
+    parser.add_argument(
+        "--inline",
+        action="store_true",
+        help="Embed charts and styles in a single self-contained HTML file",
+    )
 
     args = parser.parse_args()
 
@@ -310,7 +340,7 @@ def main():
         data = load_analysis_data(args.input_dir)
 
         # Generate HTML report
-        generate_html_report(data, args.output)
+        generate_html_report(data, args.output, inline=args.inline)
 
         print(f"Performance report generated: {args.output}")
 
@@ -8,14 +8,81 @@ import json
 import os
 import sys
 import argparse
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-import statistics
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Result files larger than this are streamed when ijson is available
+_STREAM_THRESHOLD = 32 * 1024 * 1024
+_STREAM_BATCH_SIZE = 4096
+
+
+def _load_json(path: Union[str, Path]):
+    """Parse a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _iter_result_files(root: str) -> Iterator[str]:
+    """Yield the paths of all non-baseline JSON files below root"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json") and "baseline" not in entry.name:
+                    yield entry.path
+
+
+def _pyplot():
+    """Import pyplot on the non-interactive Agg backend, on first use"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _dump_json(path: Path, data) -> None:
+    """Write data as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        encoded = orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+        # orjson writes non-ASCII labels as raw UTF-8; keep json's \uXXXX escapes
+        if encoded.isascii():
+            path.write_bytes(encoded)
+            return
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+# Charts are CI artifacts: render them at screen resolution and keep PNG
+# compression cheap
+_CHART_DPI = 110
+_PNG_OPTIONS = {"optimize": False, "compress_level": 1}
 
 
 @dataclass
@@ -43,6 +110,41 @@ class BenchmarkResult:
     platform: str = ""
 
 
+# Results are stored column-wise, one list per BenchmarkResult field
+Columns = Dict[str, list]
+_RESULT_COLUMNS = tuple(field.name for field in fields(BenchmarkResult))
+
+
+def _empty_columns() -> Columns:
+    return {name: [] for name in _RESULT_COLUMNS}
+
+
+def _extend_columns(columns: Columns, other: Columns) -> None:
+    for name, values in other.items():
+        columns[name].extend(values)
+
+
+def _successful_mean(values: list, ok: np.ndarray, successful: int) -> float:
+    """Mean of the values whose success flag is set, reduced in place"""
+    array = np.fromiter(values, dtype=np.float64, count=len(ok))
+    return float(np.add.reduce(array, where=ok)) / successful
+
+
+def _boxplot(ax, successful_df: "pd.DataFrame", by: str, column: str) -> None:
+    """Draw one box of column values per group, in first-seen group order"""
+    groups = successful_df.groupby(by, observed=True, sort=False)[column]
+    labels, data = zip(*((label, values.to_numpy()) for label, values in groups))
+    ax.boxplot(data)
+    ax.set_xticks(range(1, len(labels) + 1), labels)
+
+
+def _to_records(columns: Columns) -> List[BenchmarkResult]:
+    return [
+        BenchmarkResult(*row)
+        for row in zip(*(columns[name] for name in _RESULT_COLUMNS))
+    ]
+
+
 @dataclass
 class PerformanceSummary:
     """Performance analysis summary"""
@@ -61,8 +163,20 @@ class PerformanceAnalyzer:
 
     def __init__(self, thresholds: PerformanceThresholds):
         self.thresholds = thresholds
-        self.results: List[BenchmarkResult] = []
-        self.baseline_results: List[BenchmarkResult] = []
+        self._columns = _empty_columns()
+        self._baseline_columns = _empty_columns()
+        self._summary_cache: Optional[PerformanceSummary] = None
+        self._summary_key: Optional[Tuple[int, int, bool]] = None
+
+    @property
+    def results(self) -> List[BenchmarkResult]:
+        """Current results as BenchmarkResult records, built on demand"""
+        return _to_records(self._columns)
+
+    @property
+    def baseline_results(self) -> List[BenchmarkResult]:
+        """Baseline results as BenchmarkResult records, built on demand"""
+        return _to_records(self._baseline_columns)
 
     def load_results(self, input_dir: str) -> None:
         """Load benchmark results from directory"""
@@ -71,67 +185,119 @@ class PerformanceAnalyzer:
         if not input_path.exists():
             raise FileNotFoundError(f"Input directory {input_dir} does not exist")
 
-        # Load current results
-        for json_file in input_path.glob("**/*.json"):
-            if "baseline" not in json_file.name:
-                self._load_json_file(json_file)
+        # Load current results, parsing files concurrently
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            json_files = _iter_result_files(input_dir)
+            for columns in executor.map(self._load_json_file, json_files):
+                _extend_columns(self._columns, columns)
 
         # Load baseline results if available
         baseline_file = input_path / "baseline.json"
         if baseline_file.exists():
             self._load_baseline_file(baseline_file)
 
-    def _load_json_file(self, json_file: Path) -> None:
+    def _load_json_file(self, json_file: str) -> Columns:
         """Load results from a single JSON file"""
         try:
-            with open(json_file, "r") as f:
-                data = json.load(f)
-
-            if isinstance(data, list):
-                for item in data:
-                    if isinstance(item, dict) and "metrics" in item:
-                        result = BenchmarkResult(
-                            suite=item.get("suite", "unknown"),
-                            name=item.get("name", "unknown"),
-                            execution_time=item["metrics"].get("executionTime", 0.0),
-                            memory_usage=item["metrics"].get("memoryUsage", 0),
-                            success=item.get("success", False),
-                            error=item.get("error"),
-                            timestamp=item["metrics"].get("timestamp", ""),
-                            lean_version=item["metrics"].get("leanVersion", ""),
-                            platform=item["metrics"].get("platform", ""),
-                        )
-                        self.results.append(result)
+            return self._read_results(json_file)
         except Exception as e:
             print(f"Warning: Could not load {json_file}: {e}")
+            return _empty_columns()
 
     def _load_baseline_file(self, baseline_file: Path) -> None:
         """Load baseline results for comparison"""
         try:
-            with open(baseline_file, "r") as f:
-                data = json.load(f)
-
-            if isinstance(data, list):
-                for item in data:
-                    if isinstance(item, dict) and "metrics" in item:
-                        result = BenchmarkResult(
-                            suite=item.get("suite", "unknown"),
-                            name=item.get("name", "unknown"),
-                            execution_time=item["metrics"].get("executionTime", 0.0),
-                            memory_usage=item["metrics"].get("memoryUsage", 0),
-                            success=item.get("success", False),
-                            error=item.get("error"),
-                            timestamp=item["metrics"].get("timestamp", ""),
-                            lean_version=item["metrics"].get("leanVersion", ""),
-                            platform=item["metrics"].get("platform", ""),
-                        )
-                        self.baseline_results.append(result)
+            _extend_columns(self._baseline_columns, self._read_results(baseline_file))
         except Exception as e:
             print(f"Warning: Could not load baseline {baseline_file}: {e}")
 
-    def analyze_performance(self) -> PerformanceSummary:
-        """Analyze performance and detect regressions"""
-        if not self.results:
+    def _read_results(self, json_file: Union[str, Path]) -> Columns:
+        """Read the benchmark results stored in a JSON file
+
+        Large files are streamed in batches of items with ijson when it is
+        installed, so the whole document is never held in memory at once.
+        """
+        if ijson is not None and os.path.getsize(json_file) > _STREAM_THRESHOLD:
+            columns = _empty_columns()
+            with open(json_file, "rb") as f:
+                items = ijson.items(f, "item", use_float=True)
+                while batch := list(islice(items, _STREAM_BATCH_SIZE)):
+                    _extend_columns(columns, self._parse_results(batch))
+            return columns
+
+        data = _load_json(json_file)
+        return self._parse_results(data if isinstance(data, list) else [])
+
+    @staticmethod
+    def _parse_results(items: list) -> Columns:
+        """Collect benchmark results from the items of a JSON array"""
+        # The array length bounds the number of results, so the columns are
+        # allocated up front and filled by index
+        size = len(items)
+        columns = {name: [None] * size for name in _RESULT_COLUMNS}
+        # Local aliases for the column lists, in BenchmarkResult field order
+        (
+            suites,
+            names,
+            execution_times,
+            memory_usages,
+            successes,
+            errors,
+            timestamps,
+            lean_versions,
+            platforms,
+        ) = columns.values()
+
+        count = 0
+        for item in items:
+            # Records are the common case; non-dict items raise TypeError
+            try:
+                metrics = item["metrics"]
+            except (KeyError, TypeError):
+                continue
+            if metrics is None:
+                continue
+
+            suites[count] = item.get("suite", "unknown")
+            names[count] = item.get("name", "unknown")
+            execution_times[count] = metrics.get("executionTime", 0.0)
+            memory_usages[count] = metrics.get("memoryUsage", 0)
+            successes[count] = bool(item.get("success", False))
+            errors[count] = item.get("error")
+            timestamps[count] = metrics.get("timestamp", "")
+            lean_versions[count] = metrics.get("leanVersion", "")
+            platforms[count] = metrics.get("platform", "")
+            count += 1
+
+        # Drop the slots of skipped items
+        if count < size:
+            for values in columns.values():
+                del values[count:]
+        return columns
+
+    def analyze_performance(self, fast_fail: bool = False) -> PerformanceSummary:
+        """Analyze performance and detect regressions
+
+        With fast_fail, the baseline comparison is skipped once a threshold
+        check has already flagged a regression. The summary is cached until
+        more results are loaded.
+        """
+        key = (
+            len(self._columns["success"]),
+            len(self._baseline_columns["success"]),
+            fast_fail,
+        )
+        if self._summary_key != key:
+            self._summary_cache = self._compute_summary(fast_fail)
+            self._summary_key = key
+        return self._summary_cache
+
+    def _compute_summary(self, fast_fail: bool) -> PerformanceSummary:
+        """Compute the performance summary from the loaded results"""
+        columns = self._columns
+        success = columns["success"]
+        if not success:
             return PerformanceSummary(
                 status="ERROR",
                 avg_execution_time=0.0,
@@ -143,25 +309,27 @@ class PerformanceAnalyzer:
             )
 
         # Calculate basic metrics
-        successful_results = [r for r in self.results if r.success]
-        failed_results = [r for r in self.results if not r.success]
+        total_benchmarks = len(success)
+        ok = np.fromiter(success, dtype=np.bool_, count=total_benchmarks)
+        successful_benchmarks = int(np.count_nonzero(ok))
+        failed_benchmarks = total_benchmarks - successful_benchmarks
 
-        if not successful_results:
+        if not successful_benchmarks:
             return PerformanceSummary(
                 status="FAILED",
                 avg_execution_time=0.0,
                 memory_usage=0.0,
                 regression_detected=True,
-                failed_benchmarks=len(failed_results),
-                total_benchmarks=len(self.results),
+                failed_benchmarks=failed_benchmarks,
+                total_benchmarks=total_benchmarks,
                 recommendations=["All benchmarks failed"],
             )
 
-        avg_execution_time = statistics.mean(
-            r.execution_time for r in successful_results
+        avg_execution_time = _successful_mean(
+            columns["execution_time"], ok, successful_benchmarks
         )
-        avg_memory_usage = statistics.mean(
-            r.memory_usage for r in successful_results
+        avg_memory_usage = _successful_mean(
+            columns["memory_usage"], ok, successful_benchmarks
         ) / (
             1024 * 1024
         )  # Convert to MB
@@ -185,18 +353,35 @@ class PerformanceAnalyzer:
             )
 
         # Check for failed benchmarks
-        if len(failed_results) > self.thresholds.max_failed_benchmarks:
+        if failed_benchmarks > self.thresholds.max_failed_benchmarks:
             regression_detected = True
             recommendations.append(
-                f"Too many failed benchmarks: {len(failed_results)} > {self.thresholds.max_failed_benchmarks}"
+                f"Too many failed benchmarks: {failed_benchmarks} > {self.thresholds.max_failed_benchmarks}"
+            )
+
+        # The verdict is already known, skip the baseline comparison
+        if fast_fail and regression_detected:
+            return PerformanceSummary(
+                status="REGRESSION",
+                avg_execution_time=avg_execution_time,
+                memory_usage=avg_memory_usage,
+                regression_detected=True,
+                failed_benchmarks=failed_benchmarks,
+                total_benchmarks=total_benchmarks,
+                recommendations=recommendations,
             )
 
         # Compare with baseline if available
-        if self.baseline_results:
-            baseline_successful = [r for r in self.baseline_results if r.success]
+        baseline = self._baseline_columns
+        if baseline["success"]:
+            baseline_total = len(baseline["success"])
+            baseline_ok = np.fromiter(
+                baseline["success"], dtype=np.bool_, count=baseline_total
+            )
+            baseline_successful = int(np.count_nonzero(baseline_ok))
             if baseline_successful:
-                baseline_avg_time = statistics.mean(
-                    r.execution_time for r in baseline_successful
+                baseline_avg_time = _successful_mean(
+                    baseline["execution_time"], baseline_ok, baseline_successful
                 )
                 time_regression = (
                     (avg_execution_time - baseline_avg_time) / baseline_avg_time
@@ -211,7 +396,7 @@ class PerformanceAnalyzer:
         # Determine overall status
         if regression_detected:
             status = "REGRESSION"
-        elif len(failed_results) > 0:
+        elif failed_benchmarks > 0:
             status = "PARTIAL"
         else:
             status = "PASS"
@@ -221,8 +406,8 @@ class PerformanceAnalyzer:
             avg_execution_time=avg_execution_time,
             memory_usage=avg_memory_usage,
             regression_detected=regression_detected,
-            failed_benchmarks=len(failed_results),
-            total_benchmarks=len(self.results),
+            failed_benchmarks=failed_benchmarks,
+            total_benchmarks=total_benchmarks,
             recommendations=recommendations,
         )
 
@@ -231,157 +416,157 @@ class PerformanceAnalyzer:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        if not self.results:
+        columns = self._columns
+        if not columns["success"]:
             print("No results to generate report for")
             return
 
-        # Create DataFrame for analysis
+        # pandas is only needed for the detailed report
+        import pandas as pd
+
+        # Create DataFrame for analysis straight from the result columns
         df = pd.DataFrame(
-            [
-                {
-                    "suite": r.suite,
-                    "name": r.name,
-                    "execution_time": r.execution_time,
-                    "memory_usage": r.memory_usage / (1024 * 1024),  # Convert to MB
-                    "success": r.success,
-                    "platform": r.platform,
-                    "lean_version": r.lean_version,
-                }
-                for r in self.results
-            ]
+            {
+                name: columns[name]
+                for name in (
+                    "suite",
+                    "name",
+                    "execution_time",
+                    "memory_usage",
+                    "success",
+                    "platform",
+                    "lean_version",
+                )
+            }
         )
+        df["memory_usage"] = df["memory_usage"] / (1024 * 1024)  # Convert to MB
+        for name in ("suite", "platform", "lean_version"):
+            df[name] = df[name].astype("category")
+
+        ok_mask = df["success"].to_numpy()
+        successful_df = df.loc[ok_mask]
+        success_rate = df.groupby("suite", observed=True)["success"].mean()
+        suite_times = successful_df.groupby("suite", observed=True, sort=False)[
+            "execution_time"
+        ].mean()
 
         # Generate visualizations
-        self._create_execution_time_plot(df, output_path)
-        self._create_memory_usage_plot(df, output_path)
-        self._create_suite_comparison_plot(df, output_path)
-        self._create_success_rate_plot(df, output_path)
+        if successful_df.empty:
+            self._create_success_rate_plot(success_rate, output_path)
+        else:
+            self._create_suite_comparison_plot(successful_df, success_rate, output_path)
 
         # Generate summary statistics
-        self._generate_summary_stats(df, output_path)
+        self._generate_summary_stats(df, successful_df, output_path)
 
         # Generate recommendations
-        self._generate_recommendations(output_path)
-
-    def _create_execution_time_plot(self, df: pd.DataFrame, output_path: Path) -> None:
-        """Create execution time visualization"""
-        plt.figure(figsize=(12, 8))
-
-        successful_df = df[df["success"] == True]
-        if not successful_df.empty:
-            sns.boxplot(data=successful_df, x="suite", y="execution_time")
-            plt.title("Execution Time by Suite")
-            plt.xlabel("Benchmark Suite")
-            plt.ylabel("Execution Time (ms)")
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            plt.savefig(
-                output_path / "execution_time_by_suite.png",
-                dpi=300,
-                bbox_inches="tight",
-            )
-            plt.close()
-
-    def _create_memory_usage_plot(self, df: pd.DataFrame, output_path: Path) -> None:
-        """Create memory usage visualization"""
-        plt.figure(figsize=(12, 8))
-
-        successful_df = df[df["success"] == True]
-        if not successful_df.empty:
-            sns.boxplot(data=successful_df, x="suite", y="memory_usage")
-            plt.title("Memory Usage by Suite")
-            plt.xlabel("Benchmark Suite")
-            plt.ylabel("Memory Usage (MB)")
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            plt.savefig(
-                output_path / "memory_usage_by_suite.png", dpi=300, bbox_inches="tight"
-            )
-            plt.close()
+        self._generate_recommendations(df, successful_df, suite_times, output_path)
 
     def _create_suite_comparison_plot(
-        self, df: pd.DataFrame, output_path: Path
+        self,
+        successful_df: "pd.DataFrame",
+        success_rate: "pd.Series",
+        output_path: Path,
     ) -> None:
-        """Create suite comparison visualization"""
-        plt.figure(figsize=(15, 10))
-
-        successful_df = df[df["success"] == True]
-        if not successful_df.empty:
-            # Create subplots
-            fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        """Create suite comparison visualization
+
+        The execution time, memory usage and success rate panels are also
+        cropped out of the rendered figure into their own images, so the
+        figure is only drawn once.
+        """
+        plt = _pyplot()
+        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+
+        # Execution time by suite
+        _boxplot(axes[0, 0], successful_df, "suite", "execution_time")
+        axes[0, 0].set_title("Execution Time by Suite")
+        axes[0, 0].set_xlabel("Suite")
+        axes[0, 0].set_ylabel("Time (ms)")
+        axes[0, 0].tick_params(axis="x", rotation=45)
+
+        # Memory usage by suite
+        _boxplot(axes[0, 1], successful_df, "suite", "memory_usage")
+        axes[0, 1].set_title("Memory Usage by Suite")
+        axes[0, 1].set_xlabel("Suite")
+        axes[0, 1].set_ylabel("Memory (MB)")
+        axes[0, 1].tick_params(axis="x", rotation=45)
+
+        # Success rate by suite
+        success_rate.plot(kind="bar", ax=axes[1, 0])
+        axes[1, 0].set_title("Success Rate by Suite")
+        axes[1, 0].set_xlabel("Suite")
+        axes[1, 0].set_ylabel("Success Rate")
+        axes[1, 0].tick_params(axis="x", rotation=45)
+
+        # Platform comparison
+        if "platform" in successful_df.columns:
+            _boxplot(axes[1, 1], successful_df, "platform", "execution_time")
+            axes[1, 1].set_title("Execution Time by Platform")
+            axes[1, 1].set_xlabel("Platform")
+            axes[1, 1].set_ylabel("Time (ms)")
+            axes[1, 1].tick_params(axis="x", rotation=45)
+
+        fig.tight_layout()
+        fig.savefig(
+            output_path / "suite_comparison.png",
+            dpi=_CHART_DPI,
+            bbox_inches="tight",
+            pil_kwargs=_PNG_OPTIONS,
+        )
 
-            # Execution time by suite
-            sns.boxplot(
-                data=successful_df, x="suite", y="execution_time", ax=axes[0, 0]
+        renderer = fig.canvas.get_renderer()
+        to_inches = fig.dpi_scale_trans.inverted()
+        for ax, file_name in (
+            (axes[0, 0], "execution_time_by_suite.png"),
+            (axes[0, 1], "memory_usage_by_suite.png"),
+            (axes[1, 0], "success_rate.png"),
+        ):
+            bbox = ax.get_tightbbox(renderer).transformed(to_inches)
+            fig.savefig(
+                output_path / file_name,
+                dpi=_CHART_DPI,
+                bbox_inches=bbox.padded(0.1),
+                pil_kwargs=_PNG_OPTIONS,
             )
-            axes[0, 0].set_title("Execution Time by Suite")
-            axes[0, 0].set_xlabel("Suite")
-            axes[0, 0].set_ylabel("Time (ms)")
-            axes[0, 0].tick_params(axis="x", rotation=45)
-
-            # Memory usage by suite
-            sns.boxplot(data=successful_df, x="suite", y="memory_usage", ax=axes[0, 1])
-            axes[0, 1].set_title("Memory Usage by Suite")
-            axes[0, 1].set_xlabel("Suite")
-            axes[0, 1].set_ylabel("Memory (MB)")
-            axes[0, 1].tick_params(axis="x", rotation=45)
-
-            # Success rate by suite
-            success_rate = df.groupby("suite")["success"].mean()
-            success_rate.plot(kind="bar", ax=axes[1, 0])
-            axes[1, 0].set_title("Success Rate by Suite")
-            axes[1, 0].set_xlabel("Suite")
-            axes[1, 0].set_ylabel("Success Rate")
-            axes[1, 0].tick_params(axis="x", rotation=45)
-
-            # Platform comparison
-            if "platform" in successful_df.columns:
-                sns.boxplot(
-                    data=successful_df, x="platform", y="execution_time", ax=axes[1, 1]
-                )
-                axes[1, 1].set_title("Execution Time by Platform")
-                axes[1, 1].set_xlabel("Platform")
-                axes[1, 1].set_ylabel("Time (ms)")
-                axes[1, 1].tick_params(axis="x", rotation=45)
-
-            plt.tight_layout()
-            plt.savefig(
-                output_path / "suite_comparison.png", dpi=300, bbox_inches="tight"
-            )
-            plt.close()
+        plt.close(fig)
 
-    def _create_success_rate_plot(self, df: pd.DataFrame, output_path: Path) -> None:
+    def _create_success_rate_plot(
+        self, success_rate: "pd.Series", output_path: Path
+    ) -> None:
         """Create success rate visualization"""
+        plt = _pyplot()
         plt.figure(figsize=(10, 6))
 
-        success_rate = df.groupby("suite")["success"].mean()
         success_rate.plot(kind="bar")
         plt.title("Success Rate by Suite")
         plt.xlabel("Benchmark Suite")
         plt.ylabel("Success Rate")
         plt.xticks(rotation=45)
         plt.tight_layout()
-        plt.savefig(output_path / "success_rate.png", dpi=300, bbox_inches="tight")
+        plt.savefig(
+            output_path / "success_rate.png",
+            dpi=_CHART_DPI,
+            bbox_inches="tight",
+            pil_kwargs=_PNG_OPTIONS,
+        )
         plt.close()
 
-    def _generate_summary_stats(self, df: pd.DataFrame, output_path: Path) -> None:
+    def _generate_summary_stats(
+        self, df: "pd.DataFrame", successful_df: "pd.DataFrame", output_path: Path
+    ) -> None:
         """Generate summary statistics"""
+        total = len(df)
+        successful = len(successful_df)
         stats = {
-            "total_benchmarks": len(df),
-            "successful_benchmarks": len(df[df["success"] == True]),
-            "failed_benchmarks": len(df[df["success"] == False]),
-            "success_rate": (
-                len(df[df["success"] == True]) / len(df) if len(df) > 0 else 0
-            ),
+            "total_benchmarks": total,
+            "successful_benchmarks": successful,
+            "failed_benchmarks": total - successful,
+            "success_rate": successful / total if total > 0 else 0,
             "avg_execution_time": (
-                df[df["success"] == True]["execution_time"].mean()
-                if len(df[df["success"] == True]) > 0
-                else 0
+                successful_df["execution_time"].mean() if successful > 0 else 0
             ),
             "avg_memory_usage": (
-                df[df["success"] == True]["memory_usage"].mean()
-                if len(df[df["success"] == True]) > 0
-                else 0
+                successful_df["memory_usage"].mean() if successful > 0 else 0
             ),
             "suites": df["suite"].unique().tolist(),
             "platforms": (
@@ -394,57 +579,47 @@ class PerformanceAnalyzer:
             ),
         }
 
-        with open(output_path / "summary_stats.json", "w") as f:
-            json.dump(stats, f, indent=2)
+        _dump_json(output_path / "summary_stats.json", stats)
 
-    def _generate_recommendations(self, output_path: Path) -> None:
+    def _generate_recommendations(
+        self,
+        df: "pd.DataFrame",
+        successful_df: "pd.DataFrame",
+        suite_times: "pd.Series",
+        output_path: Path,
+    ) -> None:
         """Generate performance recommendations"""
         recommendations = []
 
-        if not self.results:
+        if df.empty:
             recommendations.append("No benchmark results available for analysis")
             return
 
-        successful_results = [r for r in self.results if r.success]
-        failed_results = [r for r in self.results if not r.success]
-
         # Check execution time
-        if successful_results:
-            avg_time = statistics.mean(r.execution_time for r in successful_results)
+        if not successful_df.empty:
+            avg_time = successful_df["execution_time"].mean()
             if avg_time > self.thresholds.execution_time_ms:
                 recommendations.append(
                     f"Consider optimizing slow operations (avg: {avg_time:.2f}ms)"
                 )
 
         # Check memory usage
-        if successful_results:
-            avg_memory = statistics.mean(r.memory_usage for r in successful_results) / (
-                1024 * 1024
-            )
+        if not successful_df.empty:
+            avg_memory = successful_df["memory_usage"].mean()
             if avg_memory > self.thresholds.memory_usage_mb:
                 recommendations.append(
                     f"Consider reducing memory usage (avg: {avg_memory:.2f}MB)"
                 )
 
         # Check failure rate
-        failure_rate = len(failed_results) / len(self.results)
+        failure_rate = (len(df) - len(successful_df)) / len(df)
         if failure_rate > 0.1:  # 10% failure rate
             recommendations.append(f"High failure rate detected: {failure_rate:.1%}")
 
         # Suite-specific recommendations
-        suite_stats = {}
-        for result in successful_results:
-            if result.suite not in suite_stats:
-                suite_stats[result.suite] = []
-            suite_stats[result.suite].append(result.execution_time)
-
-        for suite, times in suite_stats.items():
-            if times:
-                avg_time = statistics.mean(times)
-                if avg_time > self.thresholds.execution_time_ms:
-                    recommendations.append(
-                        f"Optimize {suite} suite (avg: {avg_time:.2f}ms)"
-                    )
+        slow_suites = suite_times[suite_times > self.thresholds.execution_time_ms]
+        for suite, avg_time in slow_suites.items():
+            recommendations.append(f"Optimize {suite} suite (avg: {avg_time:.2f}ms)")
 
         with open(output_path / "recommendations.txt", "w") as f:
             f.write("Performance Recommendations\n")
@@ -452,9 +627,9 @@ class PerformanceAnalyzer:
             for i, rec in enumerate(recommendations, 1):
                 f.write(f"{i}. {rec}\n")
 
-    def save_summary(self, output_dir: str) -> None:
+    def save_summary(self, output_dir: str, fast_fail: bool = False) -> None:
         """Save performance summary for CI/CD integration"""
-        summary = self.analyze_performance()
+        summary = self.analyze_performance(fast_fail)
 
         summary_data = {
             "status": summary.status,
@@ -464,14 +639,13 @@ class PerformanceAnalyzer:
             "failed_benchmarks": summary.failed_benchmarks,
             "total_benchmarks": summary.total_benchmarks,
             "recommendations": summary.recommendations,
-            "timestamp": pd.Timestamp.now().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path / "performance-summary.json", "w") as f:
-            json.dump(summary_data, f, indent=2)
+        _dump_json(output_path / "performance-summary.json", summary_data)
 
 
 def main():
@@ -490,6 +664,16 @@ def main():
         "--threshold", type=float, default=10.0, help="Regression threshold percentage"
     )
     parser.add_argument("--baseline", action="store_true", help="Set as new baseline")
+    parser.add_argument(
+        "--no-report",
+        action="store_true",
+        help="Only save the summary, skip the charts and detailed statistics",
+    )
+    parser.add_argument(
+        "--fast-fail",
+        action="store_true",
+        help="Skip the baseline comparison once a regression is already detected",
+    )
 
     args = parser.parse_args()
 
@@ -504,13 +688,14 @@ def main():
         analyzer.load_results(args.input_dir)
 
         # Analyze performance
-        summary = analyzer.analyze_performance()
+        summary = analyzer.analyze_performance(fast_fail=args.fast_fail)
 
         # Generate detailed report
-        analyzer.generate_detailed_report(args.output_dir)
+        if not args.no_report:
+            analyzer.generate_detailed_report(args.output_dir)
 
         # Save summary
-        analyzer.save_summary(args.output_dir)
+        analyzer.save_summary(args.output_dir, fast_fail=args.fast_fail)
 
         # Print summary
         print("Performance Analysis Summary")
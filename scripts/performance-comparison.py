@@ -8,15 +8,71 @@ import json
 import sys
 import argparse
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from string import Template
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
-import statistics
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# (avg execution time ms, avg memory MB, failure rate, successful, total)
+Metrics = Tuple[float, float, float, int, int]
+
+# Exact reciprocal of 1024 * 1024, so scaling by it matches dividing
+_MB_PER_BYTE = 1.0 / 1048576.0
+
+# The detailed comparison has a fixed shape, laid out as json.dump(indent=2) would
+_COMPARISON_JSON = """{
+  "baseline": {
+    "execution_time": $baseline_execution_time,
+    "memory_usage": $baseline_memory_usage,
+    "failure_rate": $baseline_failure_rate,
+    "successful_benchmarks": $baseline_successful_benchmarks,
+    "total_benchmarks": $baseline_total_benchmarks
+  },
+  "current": {
+    "execution_time": $current_execution_time,
+    "memory_usage": $current_memory_usage,
+    "failure_rate": $current_failure_rate,
+    "successful_benchmarks": $current_successful_benchmarks,
+    "total_benchmarks": $current_total_benchmarks
+  },
+  "changes": {
+    "execution_time_percent": $changes_execution_time_percent,
+    "memory_usage_percent": $changes_memory_usage_percent,
+    "failure_rate_absolute": $changes_failure_rate_absolute
+  },
+  "regressions": {
+    "execution_time": $regressions_execution_time,
+    "memory_usage": $regressions_memory_usage,
+    "failure_rate": $regressions_failure_rate
+  }
+}"""
+_COMPARISON_TEMPLATE = Template(_COMPARISON_JSON)
+
+
+def _format_comparison(comparison: Dict) -> str:
+    """Render the detailed comparison as indented JSON without the json encoder"""
+    if not comparison:
+        return "{}"
+    return _COMPARISON_TEMPLATE.substitute(
+        {
+            f"{section}_{key}": json.dumps(value)
+            for section, values in comparison.items()
+            for key, value in values.items()
+        }
+    )
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ComparisonThresholds:
     """Comparison thresholds"""
 
@@ -26,7 +82,7 @@ class ComparisonThresholds:
     min_benchmarks: int = 5
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComparisonResult:
     """Comparison result"""
 
@@ -41,11 +97,18 @@ class ComparisonResult:
 class PerformanceComparator:
     """Performance comparator"""
 
-    def __init__(self, thresholds: ComparisonThresholds):
+    def __init__(
+        self,
+        thresholds: ComparisonThresholds,
+        charts: bool = True,
+        always_chart: bool = False,
+    ):
         self.thresholds = thresholds
+        self.charts = charts
+        self.always_chart = always_chart
 
-    def load_baseline(self, baseline_file: str) -> Optional[Dict]:
-        """Load baseline performance data"""
+    def load_baseline(self, baseline_file: str) -> Optional[Metrics]:
+        """Load baseline performance data and extract its metrics"""
         baseline_path = Path(baseline_file)
 
         if not baseline_path.exists():
@@ -53,14 +116,13 @@ class PerformanceComparator:
             return None
 
         try:
-            with open(baseline_path, "r") as f:
-                return json.load(f)
+            return self._read_metrics(baseline_path)
         except Exception as e:
             print(f"Error loading baseline: {e}")
             return None
 
-    def load_current(self, current_file: str) -> Optional[Dict]:
-        """Load current performance data"""
+    def load_current(self, current_file: str) -> Optional[Metrics]:
+        """Load current performance data and extract its metrics"""
         current_path = Path(current_file)
 
         if not current_path.exists():
@@ -68,65 +130,79 @@ class PerformanceComparator:
             return None
 
         try:
-            with open(current_path, "r") as f:
-                return json.load(f)
+            return self._read_metrics(current_path)
         except Exception as e:
             print(f"Error loading current performance: {e}")
             return None
 
-    def extract_metrics(self, data: Dict) -> Tuple[float, float, float, int, int]:
+    def _read_metrics(self, path: Path) -> Metrics:
+        """Read a performance file and reduce it to its metrics
+
+        When ijson is installed, result arrays are streamed and reduced as
+        they are parsed, so the file is never held in memory as a whole.
+        """
+        if ijson is not None:
+            with open(path, "rb") as f:
+                is_array = f.read(64).lstrip()[:1] == b"["
+                f.seek(0)
+                if is_array:
+                    return self._extract_from_results(
+                        ijson.items(f, "item", use_float=True)
+                    )
+
+        with open(path, "rb") as f:
+            raw = f.read()
+        return self.extract_metrics(
+            orjson.loads(raw) if orjson is not None else json.loads(raw)
+        )
+
+    def extract_metrics(self, data) -> Metrics:
         """Extract key metrics from performance data"""
         if isinstance(data, list):
             # Handle list of benchmark results
-            successful_results = [r for r in data if r.get("success", False)]
-            failed_results = [r for r in data if not r.get("success", False)]
-
-            if not successful_results:
-                return 0.0, 0.0, 1.0, 0, len(data)
-
-            execution_times = [
-                r.get("metrics", {}).get("executionTime", 0) for r in successful_results
-            ]
-            memory_usage = [
-                r.get("metrics", {}).get("memoryUsage", 0) for r in successful_results
-            ]
-
-            avg_execution_time = (
-                statistics.mean(execution_times) if execution_times else 0.0
-            )
-            avg_memory_usage = (
-                statistics.mean(memory_usage) / (1024 * 1024) if memory_usage else 0.0
-            )  # Convert to MB
-            failure_rate = len(failed_results) / len(data) if data else 0.0
-
-            return (
-                avg_execution_time,
-                avg_memory_usage,
-                failure_rate,
-                len(successful_results),
-                len(data),
-            )
+            return self._extract_from_results(data)
 
         elif isinstance(data, dict):
             # Handle summary format
+            total = data.get("total_benchmarks", 0)
+            failed = data.get("failed_benchmarks", 0)
             return (
                 data.get("avg_execution_time", 0.0),
                 data.get("memory_usage", 0.0),
-                data.get("failed_benchmarks", 0)
-                / max(data.get("total_benchmarks", 1), 1),
+                failed / max(total, 1),
                 data.get("successful_benchmarks", 0),
-                data.get("total_benchmarks", 0),
+                total,
             )
 
         return 0.0, 0.0, 0.0, 0, 0
 
+    def _extract_from_results(self, results: Iterable[Dict]) -> Metrics:
+        """Reduce benchmark results to their metrics in a single pass"""
+        total_time = 0.0
+        total_memory = 0.0
+        successful = 0
+        total = 0
+        for r in results:
+            total += 1
+            if r.get("success", False):
+                metrics = r.get("metrics") or {}
+                total_time += metrics.get("executionTime", 0)
+                total_memory += metrics.get("memoryUsage", 0)
+                successful += 1
+
+        if not successful:
+            return 0.0, 0.0, 1.0, 0, total
+
+        avg_execution_time = total_time / successful
+        avg_memory_usage = total_memory / successful * _MB_PER_BYTE
+        failure_rate = (total - successful) / total
+
+        return avg_execution_time, avg_memory_usage, failure_rate, successful, total
+
     def compare_performance(
-        self, baseline_data: Dict, current_data: Dict
+        self, baseline_metrics: Metrics, current_metrics: Metrics
     ) -> ComparisonResult:
-        """Compare performance between baseline and current"""
-        baseline_metrics = self.extract_metrics(baseline_data)
-        current_metrics = self.extract_metrics(current_data)
-
+        """Compare performance between baseline and current metrics"""
         (
             baseline_time,
             baseline_memory,
@@ -183,26 +259,26 @@ class PerformanceComparator:
             execution_time_regression or memory_regression or failure_rate_regression
         )
 
-        # Generate recommendations
-        recommendations = []
+        # Generate recommendations, the happy path needs no per-metric checks
+        if not has_regression:
+            recommendations = ["No significant performance regression detected"]
+        else:
+            recommendations = []
 
-        if execution_time_regression:
-            recommendations.append(
-                f"Execution time increased by {execution_time_change:.1f}% (threshold: {self.thresholds.execution_time_percent}%)"
-            )
+            if execution_time_regression:
+                recommendations.append(
+                    f"Execution time increased by {execution_time_change:.1f}% (threshold: {self.thresholds.execution_time_percent}%)"
+                )
 
-        if memory_regression:
-            recommendations.append(
-                f"Memory usage increased by {memory_change:.1f}% (threshold: {self.thresholds.memory_usage_percent}%)"
-            )
+            if memory_regression:
+                recommendations.append(
+                    f"Memory usage increased by {memory_change:.1f}% (threshold: {self.thresholds.memory_usage_percent}%)"
+                )
 
-        if failure_rate_regression:
-            recommendations.append(
-                f"Failure rate increased by {failure_rate_change:.1%} (threshold: {self.thresholds.failure_rate_increase}%)"
-            )
-
-        if not has_regression:
-            recommendations.append("No significant performance regression detected")
+            if failure_rate_regression:
+                recommendations.append(
+                    f"Failure rate increased by {failure_rate_change:.1%} (threshold: {self.thresholds.failure_rate_increase}%)"
+                )
 
         # Create detailed comparison
         detailed_comparison = {
@@ -250,18 +326,26 @@ class PerformanceComparator:
 
         # Save detailed comparison
         with open(output_path / "performance-comparison.json", "w") as f:
-            json.dump(result.detailed_comparison, f, indent=2)
+            f.write(_format_comparison(result.detailed_comparison))
 
-        # Generate visualizations
-        self._create_comparison_charts(result, output_path)
+        # Charts only get looked at when something regressed, so skip them otherwise
+        if self.charts and (result.has_regression or self.always_chart):
+            dpi = 300 if result.has_regression else 100
+            self._create_comparison_charts(result, output_path, dpi)
 
         # Generate summary report
         self._generate_summary_report(result, output_path)
 
     def _create_comparison_charts(
-        self, result: ComparisonResult, output_path: Path
+        self, result: ComparisonResult, output_path: Path, dpi: int = 300
     ) -> None:
         """Create comparison charts"""
+        # matplotlib is only needed here, import it on the headless backend
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
         comparison = result.detailed_comparison
 
         # Create comparison bar chart
@@ -316,7 +400,7 @@ class PerformanceComparator:
 
         plt.tight_layout()
         plt.savefig(
-            output_path / "performance-comparison.png", dpi=300, bbox_inches="tight"
+            output_path / "performance-comparison.png", dpi=dpi, bbox_inches="tight"
         )
         plt.close()
 
@@ -394,6 +478,14 @@ def main():
         default=5,
         help="Minimum number of successful benchmarks required",
     )
+    parser.add_argument(
+        "--no-charts", action="store_true", help="Skip generating comparison charts"
+    )
+    parser.add_argument(
+        "--always-chart",
+        action="store_true",
+        help="Generate comparison charts even when no regression is detected",
+    )
 
     args = parser.parse_args()
 
@@ -406,18 +498,20 @@ def main():
     )
 
     # Create comparator
-    comparator = PerformanceComparator(thresholds)
+    comparator = PerformanceComparator(
+        thresholds, charts=not args.no_charts, always_chart=args.always_chart
+    )
 
     # Load data
-    baseline_data = comparator.load_baseline(args.baseline)
-    current_data = comparator.load_current(args.current)
+    baseline_metrics = comparator.load_baseline(args.baseline)
+    current_metrics = comparator.load_current(args.current)
 
-    if baseline_data is None or current_data is None:
+    if baseline_metrics is None or current_metrics is None:
         print("Error: Could not load performance data")
         sys.exit(1)
 
     # Compare performance
-    result = comparator.compare_performance(baseline_data, current_data)
+    result = comparator.compare_performance(baseline_metrics, current_metrics)
 
     # Generate report
     comparator.generate_comparison_report(result, args.output_dir)
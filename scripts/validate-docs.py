@@ -7,9 +7,33 @@ This script validates documentation links, examples, and completeness.
 
 import os
 import re
+from bisect import bisect_right
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import Callable, List, Dict, Optional, Set, Tuple
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# The link patterns are RE2-compatible, so use the linear-time engine if present
+_link_engine = re2 if re2 is not None else re
+
+_LINK_RE = _link_engine.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_CODE_RE = re.compile(r"```lean\n(.*?)\n```", re.DOTALL)
+_HEADER_RE = re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE)
+# Lines starting with '#' that are not 1-6 hashes followed by whitespace
+_MALFORMED_HEADER_RE = re.compile(r"^(?!#{1,6}[^\S\n])#.*$", re.MULTILINE)
+_URL_RE = re.compile(r"^https?://[^\s/$.?#].[^\s]*$")
+_MALFORMED_LINK_RE = _link_engine.compile(r"\[[^\]]+\]\([^)]+\)")
+_LINK_LINE_RE = re.compile(r"^.*\]\(.*$", re.MULTILINE)
+_NEWLINE_RE = re.compile(r"\n")
+_ANCHOR_STRIP_RE = re.compile(r"[^\w\s-]")
+_ANCHOR_DASH_RE = re.compile(r"[-\s]+")
+
+Findings = Tuple[List[str], List[str]]
 
 
 class DocValidator:
@@ -18,11 +42,37 @@ class DocValidator:
         self.src_dir = Path(src_dir)
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        self._content_cache: Dict[Path, str] = {}
+        self._anchors_cache: Dict[Path, Set[str]] = {}
+        self._md_files: Optional[Tuple[Path, ...]] = None
+
+    def _read(self, path: Path) -> str:
+        """Read a file once and serve later reads from the cache."""
+        content = self._content_cache.get(path)
+        if content is None:
+            content = self._content_cache[path] = path.read_text()
+        return content
+
+    def _markdown_files(self) -> Tuple[Path, ...]:
+        """Walk the docs tree for markdown files once per validator."""
+        if self._md_files is None:
+            self._md_files = tuple(self.docs_dir.rglob("*.md"))
+        return self._md_files
+
+    def _validate_files(self, check: Callable[[Path], Findings]) -> None:
+        """Run a per-file check over every markdown file in parallel."""
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # map() yields in submission order, so the report stays stable
+            for errors, warnings in executor.map(check, self._markdown_files()):
+                self.errors.extend(errors)
+                self.warnings.extend(warnings)
 
     def validate_all(self) -> bool:
         """Validate all documentation."""
         print("Validating documentation...")
 
+        self._md_files = tuple(self.docs_dir.rglob("*.md"))
+
         self.validate_links()
         self.validate_examples()
         self.validate_completeness()
@@ -48,70 +98,69 @@ class DocValidator:
         """Validate internal and external links."""
         print("Validating links...")
 
-        # Find all markdown files
-        md_files = list(self.docs_dir.rglob("*.md"))
+        self._validate_files(self.validate_file_links)
 
-        for md_file in md_files:
-            self.validate_file_links(md_file)
-
-    def validate_file_links(self, file_path: Path) -> None:
+    def validate_file_links(self, file_path: Path) -> Findings:
         """Validate links in a specific file."""
-        content = file_path.read_text()
+        content = self._read(file_path)
+        errors: List[str] = []
+        warnings: List[str] = []
 
         # Find all markdown links
-        link_pattern = r"\[([^\]]+)\]\(([^)]+)\)"
-        for match in re.finditer(link_pattern, content):
+        for match in _LINK_RE.finditer(content):
             link_text = match.group(1)
             link_url = match.group(2)
 
             if link_url.startswith("http"):
                 # External link - just check if it's well-formed
                 if not self.is_valid_url(link_url):
-                    self.errors.append(f"Invalid URL in {file_path}: {link_url}")
+                    errors.append(f"Invalid URL in {file_path}: {link_url}")
             elif link_url.startswith("#"):
                 # Anchor link - check if target exists
                 if not self.anchor_exists(file_path, link_url[1:]):
-                    self.warnings.append(f"Missing anchor in {file_path}: {link_url}")
+                    warnings.append(f"Missing anchor in {file_path}: {link_url}")
             elif link_url.endswith(".md"):
                 # Internal markdown link
                 target_path = self.resolve_internal_link(file_path, link_url)
                 if not target_path.exists():
-                    self.errors.append(f"Missing file in {file_path}: {link_url}")
+                    errors.append(f"Missing file in {file_path}: {link_url}")
             else:
                 # Other internal link
                 target_path = self.resolve_internal_link(file_path, link_url)
                 if not target_path.exists():
-                    self.warnings.append(f"Missing file in {file_path}: {link_url}")
+                    warnings.append(f"Missing file in {file_path}: {link_url}")
+
+        return errors, warnings
 
     def validate_examples(self) -> None:
         """Validate code examples."""
         print("Validating examples...")
 
-        # Find all markdown files
-        md_files = list(self.docs_dir.rglob("*.md"))
+        self._validate_files(self.validate_file_examples)
 
-        for md_file in md_files:
-            self.validate_file_examples(md_file)
-
-    def validate_file_examples(self, file_path: Path) -> None:
+    def validate_file_examples(self, file_path: Path) -> Findings:
         """Validate code examples in a specific file."""
-        content = file_path.read_text()
+        content = self._read(file_path)
+        if "```lean" not in content:
+            return [], []
+        warnings: List[str] = []
 
         # Find all code blocks
-        code_block_pattern = r"```lean\n(.*?)\n```"
-        for match in re.finditer(code_block_pattern, content, re.DOTALL):
+        for match in _CODE_RE.finditer(content):
             code = match.group(1)
 
             # Check for common issues
             if "sorry" in code:
-                self.warnings.append(f"Code block contains 'sorry' in {file_path}")
+                warnings.append(f"Code block contains 'sorry' in {file_path}")
 
             if "TODO" in code or "FIXME" in code:
-                self.warnings.append(f"Code block contains TODO/FIXME in {file_path}")
+                warnings.append(f"Code block contains TODO/FIXME in {file_path}")
 
             # Check for syntax issues
             if not self.is_valid_lean_syntax(code):
-                self.warnings.append(f"Potential syntax issue in {file_path}")
+                warnings.append(f"Potential syntax issue in {file_path}")
+
+        return [], warnings
 
     def validate_completeness(self) -> None:
         """Validate documentation completeness."""
@@ -133,7 +182,7 @@ class DocValidator:
         # Check for required sections in main README
         readme_path = self.docs_dir / "README.md"
         if readme_path.exists():
-            content = readme_path.read_text()
+            content = self._read(readme_path)
             required_sections = [
                 "Quick Start",
                 "Core Concepts",
@@ -149,34 +198,36 @@ class DocValidator:
         """Validate markdown syntax."""
         print("Validating markdown syntax...")
 
-        # Find all markdown files
-        md_files = list(self.docs_dir.rglob("*.md"))
+        self._validate_files(self.validate_file_syntax)
 
-        for md_file in md_files:
-            self.validate_file_syntax(md_file)
-
-    def validate_file_syntax(self, file_path: Path) -> None:
+    def validate_file_syntax(self, file_path: Path) -> Findings:
         """Validate markdown syntax in a specific file."""
-        content = file_path.read_text()
-
-        # Check for common markdown issues
-        lines = content.split("\n")
-
-        for i, line in enumerate(lines, 1):
-            # Check for unclosed code blocks
-            if line.startswith("```") and not line.endswith("```"):
-                # This is a code block start
-                pass
+        content = self._read(file_path)
 
-            # Check for malformed headers
-            if line.startswith("#"):
-                if not re.match(r"^#{1,6}\s+", line):
-                    self.warnings.append(f"Malformed header in {file_path}:{i}")
-
-            # Check for malformed links
-            if "](" in line and not re.search(r"\[[^\]]+\]\([^)]+\)", line):
-                self.warnings.append(f"Malformed link in {file_path}:{i}")
+        # Offsets of offending lines, headers sort before links on the same line
+        issues: List[Tuple[int, str]] = [
+            (match.start(), "header")
+            for match in _MALFORMED_HEADER_RE.finditer(content)
+        ]
+        if "](" in content:
+            issues.extend(
+                (match.start(), "link")
+                for match in _LINK_LINE_RE.finditer(content)
+                if not _MALFORMED_LINK_RE.search(match.group())
+            )
+        if not issues:
+            return [], []
+        issues.sort()
+
+        # Map offsets to 1-based line numbers through the line start table
+        line_starts = [0]
+        line_starts.extend(match.end() for match in _NEWLINE_RE.finditer(content))
+        warnings = [
+            f"Malformed {kind} in {file_path}:{bisect_right(line_starts, offset)}"
+            for offset, kind in issues
+        ]
 
+        return [], warnings
 
     def is_valid_lean_syntax(self, code: str) -> bool:
         """Lightweight sanity check for Lean example blocks."""
@@ -186,25 +237,23 @@ class DocValidator:
 
     def is_valid_url(self, url: str) -> bool:
         """Check if URL is well-formed."""
-        url_pattern = r"^https?://[^\s/$.?#].[^\s]*$"
-        return bool(re.match(url_pattern, url))
+        return bool(_URL_RE.match(url))
 
     def anchor_exists(self, file_path: Path, anchor: str) -> bool:
         """Check if anchor exists in file."""
-        content = file_path.read_text()
-
-        # Look for headers that could be anchors
-        header_pattern = r"^#{1,6}\s+(.+)$"
-        for match in re.finditer(header_pattern, content, re.MULTILINE):
-            header_text = match.group(1)
-            # Convert header to anchor (simplified)
-            header_anchor = re.sub(r"[^\w\s-]", "", header_text.lower())
-            header_anchor = re.sub(r"[-\s]+", "-", header_anchor)
-
-            if header_anchor == anchor:
-                return True
-
-        return False
+        anchors = self._anchors_cache.get(file_path)
+        if anchors is None:
+            anchors = set()
+            # Look for headers that could be anchors
+            for match in _HEADER_RE.finditer(self._read(file_path)):
+                header_text = match.group(1)
+                # Convert header to anchor (simplified)
+                header_anchor = _ANCHOR_STRIP_RE.sub("", header_text.lower())
+                anchors.add(_ANCHOR_DASH_RE.sub("-", header_anchor))
+            # Publish only the complete set, other workers may look it up
+            self._anchors_cache[file_path] = anchors
+
+        return anchor in anchors
 
     def resolve_internal_link(self, from_file: Path, link: str) -> Path:
         """Resolve internal link to absolute path."""